@@ -6,7 +6,7 @@ from pynastran95.models import (
     NastranResult,
     StressResult,
 )
-from pynastran95.runner import NastranRunner, run
+from pynastran95.runner import NastranRunner, parse_many, run
 
 __all__ = [
     "DisplacementResult",
@@ -14,6 +14,7 @@ __all__ = [
     "NastranResult",
     "NastranRunner",
     "StressResult",
+    "parse_many",
     "run",
 ]
 
@@ -6,12 +6,14 @@ when installed from a wheel.
 
 from __future__ import annotations
 
+import functools
 import platform
 from pathlib import Path
 
 _DATA_DIR = Path(__file__).parent
 
 
+@functools.cache
 def get_executable() -> Path | None:
     """Return path to the bundled nastrn executable, or None if not found."""
     name = "nastrn.exe" if platform.system() == "Windows" else "nastrn"
@@ -19,6 +21,7 @@ def get_executable() -> Path | None:
     return exe if exe.exists() else None
 
 
+@functools.cache
 def get_rfdir() -> Path | None:
     """Return path to the bundled rigid format directory, or None if not found."""
     rf = _DATA_DIR / "rf"
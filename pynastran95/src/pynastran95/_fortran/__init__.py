@@ -12,15 +12,23 @@ Once built, the _nastran_core module provides:
 
 from __future__ import annotations
 
+import functools
 import importlib
+import os
 from pathlib import Path
 
 
+@functools.cache
 def is_built() -> bool:
-    """Check if the f2py extension has been built."""
-    fortran_dir = Path(__file__).parent
-    so_files = list(fortran_dir.glob("_nastran_core*.so"))
-    return len(so_files) > 0
+    """Check if the f2py extension has been built.
+
+    Memoized: the extension doesn't appear or disappear mid-process, and
+    this is called on hot import paths.
+    """
+    with os.scandir(os.path.dirname(__file__)) as it:
+        return any(
+            entry.name.startswith("_nastran_core") and entry.name.endswith(".so") for entry in it
+        )
 
 
 def get_core():
@@ -0,0 +1,69 @@
+"""Shared Fortran source enumeration for the build scripts.
+
+Both the hatch build hook and the f2py build script need the same list of
+translation units. This module derives it once, caches it in memory, and
+persists a JSON manifest keyed on source-directory mtimes so repeated
+builds skip the readdir/stat traffic of re-globbing three directories.
+
+Kept free of package-relative imports so the hatch hook can load it by
+file path without pulling in the package (and its numpy dependency).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import os
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
+BUILD_DIR = REPO_ROOT / "build"
+SRC_MIS = BUILD_DIR / "src_mis"
+SRC_MDS = BUILD_DIR / "src_mds"
+SRC_BD = BUILD_DIR / "src_bd"
+SRC_BIN = BUILD_DIR / "src_bin"
+STUBS = BUILD_DIR / "stubs.f"
+MANIFEST = BUILD_DIR / "_sources_manifest.json"
+
+# Files with a PROGRAM statement; excluded from library compilation.
+SKIP_PROGRAMS = {"chkfil.f", "nastrn.f"}
+
+_SRC_DIRS = (SRC_MIS, SRC_MDS, SRC_BD)
+
+
+def _dir_mtimes() -> dict[str, float]:
+    return {d.name: os.stat(d).st_mtime for d in _SRC_DIRS}
+
+
+@functools.cache
+def _library_sources() -> tuple[Path, ...]:
+    """Sorted library sources (no main programs), manifest-cached on disk."""
+    mtimes = _dir_mtimes()
+    if MANIFEST.exists():
+        try:
+            manifest = json.loads(MANIFEST.read_text())
+        except (ValueError, OSError):
+            manifest = None
+        if manifest and manifest.get("mtimes") == mtimes:
+            return tuple(Path(p) for p in manifest["sources"])
+
+    sources: list[Path] = []
+    for src_dir in _SRC_DIRS:
+        sources.extend(f for f in sorted(src_dir.glob("*.f")) if f.name not in SKIP_PROGRAMS)
+    sources.append(STUBS)
+    with contextlib.suppress(OSError):
+        MANIFEST.write_text(json.dumps({"mtimes": mtimes, "sources": [str(p) for p in sources]}))
+    return tuple(sources)
+
+
+def enumerate_sources(include_main: bool = False) -> list[Path]:
+    """Return all Fortran sources to compile, in deterministic order.
+
+    With include_main the nastrn.f main program is appended last, for
+    builds that link the standalone executable.
+    """
+    sources = list(_library_sources())
+    if include_main:
+        sources.append(SRC_BIN / "nastrn.f")
+    return sources
@@ -10,19 +10,19 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
 import os
+import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Paths
-REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
-BUILD_DIR = REPO_ROOT / "build"
-SRC_MIS = BUILD_DIR / "src_mis"
-SRC_MDS = BUILD_DIR / "src_mds"
-SRC_BD = BUILD_DIR / "src_bd"
-STUBS = BUILD_DIR / "stubs.f"
+from pynastran95._fortran._sources import BUILD_DIR, REPO_ROOT, enumerate_sources
+
 INCLUDE_DIR = BUILD_DIR  # For .COM files
 
 FORTRAN_DIR = Path(__file__).resolve().parent
@@ -30,8 +30,11 @@ ENTRY_POINT = FORTRAN_DIR / "nastran_entry.f"
 EXIT_OVERRIDE = FORTRAN_DIR / "exit_override.f"
 OUTPUT_DIR = FORTRAN_DIR
 
-# Compiler flags (same as README)
-FLAGS = [
+# Compiler flags (same as README), plus optimization: the solver is
+# compute-bound numerical Fortran, so build it optimized with link-time
+# optimization. Set NASTRAN_MARCH="-march=native -mtune=native" for builds
+# that only need to run on the local machine.
+FLAGS: tuple[str, ...] = (
     "-std=legacy",
     "-fno-range-check",
     "-w",
@@ -39,46 +42,146 @@ FLAGS = [
     "-fallow-invalid-boz",
     "-fno-automatic",
     "-fPIC",  # Required for shared library
-]
+    "-O2",
+    "-flto=auto",
+    "-fomit-frame-pointer",
+    "-fopenmp",
+    *os.environ.get("NASTRAN_MARCH", "").split(),
+)
+
+
+# Drive gfortran through ccache when available so unchanged translation
+# units hit the cache instead of recompiling.
+_CCACHE = shutil.which("ccache")
+GFORTRAN: tuple[str, ...] = (_CCACHE, "gfortran") if _CCACHE else ("gfortran",)
+
+
+def _jobs() -> int:
+    """Number of parallel compile jobs (override with NASTRAN_JOBS).
+
+    Uses the scheduler affinity mask rather than the raw core count, so
+    cgroup-limited CI containers don't oversubscribe their CPU quota.
+    """
+    explicit = int(os.environ.get("NASTRAN_JOBS", "0"))
+    if explicit:
+        return explicit
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _lower_priority() -> None:
+    """Pool initializer: nice the compile workers to yield to interactive work."""
+    with contextlib.suppress(OSError):
+        os.nice(10)
+
+
+def _cc(cmd: tuple[str, ...]) -> subprocess.CompletedProcess[str]:
+    """Run a single compile command (module-level so it pickles for the pool)."""
+    env = os.environ.copy()
+    if _CCACHE:
+        env.setdefault("CCACHE_SLOPPINESS", "time_macros,include_file_mtime")
+        env.setdefault("CCACHE_BASEDIR", str(REPO_ROOT))
+    # gfortran only writes diagnostics to stderr (and -w suppresses
+    # warnings), so discard stdout rather than buffering it per file.
+    return subprocess.run(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=env
+    )
 
 
 def collect_sources() -> list[Path]:
-    """Collect all Fortran source files."""
-    sources: list[Path] = []
-    for src_dir in [SRC_MIS, SRC_MDS, SRC_BD]:
-        sources.extend(sorted(src_dir.glob("*.f")))
-    sources.append(STUBS)
-    return sources
+    """Collect all Fortran source files (shared with the hatch build hook)."""
+    return enumerate_sources()
+
+
+_INCLUDE_RE = re.compile(rb"^\s*INCLUDE\s+['\"]([^'\"]+)", re.I | re.M)
+
+
+@functools.cache
+def _include_digest(name: str) -> bytes:
+    """Digest of one .COM include file, read at most once per build.
+
+    The handful of .COM files are INCLUDEd by most of the ~1800 sources;
+    without this cache the key computation re-reads each include once per
+    source. (Preprocessing the includes away entirely isn't an option:
+    gfortran -E -cpp leaves Fortran INCLUDE statements unexpanded, they
+    are handled by the front end, not the preprocessor.)
+    """
+    inc_path = INCLUDE_DIR / name
+    if not inc_path.exists():
+        return b""
+    return hashlib.sha256(inc_path.read_bytes()).digest()
+
+
+def _obj_key(src: Path) -> str:
+    """Content hash covering a source file, its INCLUDEd files, and the flags.
+
+    Unlike an mtime comparison this stays correct when .COM include files
+    change or when git checkout touches timestamps without changing content.
+    """
+    h = hashlib.sha256()
+    data = src.read_bytes()
+    h.update(data)
+    for inc in _INCLUDE_RE.findall(data):
+        h.update(_include_digest(inc.decode("ascii", "replace")))
+    h.update(repr(sorted(FLAGS)).encode())
+    return h.hexdigest()
 
 
 def compile_objects(sources: list[Path], obj_dir: Path) -> list[Path]:
     """Compile Fortran sources to object files."""
     obj_dir.mkdir(parents=True, exist_ok=True)
     objects: list[Path] = []
-    skip = {"nastrn.o", "chkfil.o"}  # Skip PROGRAM files
 
+    cache_dir = obj_dir / ".cache"
+    cache_dir.mkdir(exist_ok=True)
+
+    # Hoist the invariant part of the compile command out of the loop
+    base_cc = (*GFORTRAN, "-c", *FLAGS, f"-I{INCLUDE_DIR}")
+    stale: list[Path] = []
+    cmds: list[tuple[str, ...]] = []
+    to_cache: list[tuple[Path, Path]] = []  # (obj_path, cache entry) to fill
     for src in sources:
-        obj_name = src.stem + ".o"
-        if obj_name in skip:
-            continue
-        obj_path = obj_dir / obj_name
+        obj_path = obj_dir / (src.stem + ".o")
         objects.append(obj_path)
 
-        # Skip if object is newer than source
-        if obj_path.exists() and obj_path.stat().st_mtime > src.stat().st_mtime:
+        # Skip compilation when the cache already holds an object built from
+        # identical source, includes, and flags.
+        cached = cache_dir / f"{_obj_key(src)}.o"
+        if cached.exists():
+            if not obj_path.exists() or not obj_path.samefile(cached):
+                obj_path.unlink(missing_ok=True)
+                os.link(cached, obj_path)
             continue
 
-        cmd = [
-            "gfortran",
-            "-c",
-            *FLAGS,
-            f"-I{INCLUDE_DIR}",
-            str(src),
-            "-o",
-            str(obj_path),
-        ]
-        print(f"  Compiling {src.name}...")
-        subprocess.run(cmd, check=True, capture_output=True)
+        stale.append(src)
+        to_cache.append((obj_path, cached))
+        cmds.append((*base_cc, str(src), "-o", str(obj_path)))
+
+    # Compile independent translation units in parallel; serial for a single
+    # file to avoid pool startup overhead.
+    jobs = _jobs()
+    if jobs > 1 and len(stale) > 1:
+        print(f"  Compiling {len(stale)} sources with {jobs} jobs...")
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_lower_priority) as ex:
+            results = ex.map(_cc, cmds)
+            for src, result, (obj_path, cached) in zip(stale, results, to_cache, strict=True):
+                if result.returncode != 0:
+                    msg = f"Failed to compile {src.name}: {result.stderr[:500]}"
+                    raise RuntimeError(msg)
+                # Link into the cache as we go, so objects built before a
+                # later failure are still reusable on the next run.
+                if not cached.exists():
+                    os.link(obj_path, cached)
+    else:
+        for src, cmd, (obj_path, cached) in zip(stale, cmds, to_cache, strict=True):
+            print(f"  Compiling {src.name}...")
+            result = _cc(cmd)
+            if result.returncode != 0:
+                msg = f"Failed to compile {src.name}: {result.stderr[:500]}"
+                raise RuntimeError(msg)
+            if not cached.exists():
+                os.link(obj_path, cached)
 
     return objects
 
@@ -101,6 +204,19 @@ def build_f2py_extension(
     python = sys.executable
     module_name = "_nastran_core"
 
+    # Skip the whole f2py/meson invocation when the inputs are unchanged:
+    # the stamp records a hash of all object files plus the entry source.
+    stamp = OUTPUT_DIR / f"{module_name}.stamp"
+    h = hashlib.sha256()
+    for obj in sorted(objects):
+        h.update(obj.read_bytes())
+    h.update(entry_source.read_bytes())
+    key = h.hexdigest()
+    existing = sorted(OUTPUT_DIR.glob(f"{module_name}*.so"))
+    if existing and stamp.exists() and stamp.read_text() == key:
+        print(f"  Up to date: {existing[0].name}")
+        return existing[0]
+
     # Compile the C exit override to an object file first
     exit_c = FORTRAN_DIR / "exit_override.c"
     exit_o = obj_dir / "exit_override_c.o" if obj_dir else OUTPUT_DIR / "exit_override_c.o"
@@ -146,15 +262,18 @@ def build_f2py_extension(
         # Check build dir
         so_files = list((OUTPUT_DIR / "_f2py_build").rglob(f"{module_name}*.so"))
         if so_files:
-            # Move to output dir
+            # Hardlink into the output dir (not move) so the preserved build
+            # dir can satisfy the stamp check on the next run.
             dest = OUTPUT_DIR / so_files[0].name
-            shutil.move(str(so_files[0]), str(dest))
+            dest.unlink(missing_ok=True)
+            os.link(so_files[0], dest)
             so_files = [dest]
 
     if not so_files:
         msg = f"Could not find built {module_name}*.so"
         raise RuntimeError(msg)
 
+    stamp.write_text(key)
     print(f"  Built {so_files[0].name}")
     return so_files[0]
 
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 import numpy as np
 import numpy.typing as npt
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DisplacementResult:
     """Displacement results from a NASTRAN analysis.
 
+    Rotations are stored as float32: the F06 output prints ~7 significant
+    digits, which float32 carries, and the narrower dtype halves memory
+    bandwidth in post-processing. Use :meth:`as_float64` to widen.
+
     Attributes:
         node_ids: Array of grid point IDs.
         translations: (N, 3) array of T1, T2, T3 translations.
@@ -21,31 +25,59 @@ class DisplacementResult:
 
     node_ids: npt.NDArray[np.int32]
     translations: npt.NDArray[np.float64]
-    rotations: npt.NDArray[np.float64]
+    rotations: npt.NDArray[np.floating]
     subcase: int = 1
 
+    def as_float64(self) -> DisplacementResult:
+        """Return a copy with all floating-point arrays widened to float64."""
+        return replace(
+            self,
+            translations=self.translations.astype(np.float64),
+            rotations=self.rotations.astype(np.float64),
+        )
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StressResult:
     """Element stress results from a NASTRAN analysis.
 
+    Stress components are stored as a single (n_elements, n_components)
+    array rather than one array per component: one allocation, contiguous
+    in memory, and cross-component expressions (e.g. von Mises) vectorize
+    over the whole block. Individual components are accessed by name via
+    indexing: ``result["axial"]``.
+
     Attributes:
         element_ids: Array of element IDs.
         element_type: Element type string (e.g. "CROD", "CBAR", "CTRIA3").
-        stresses: Dict mapping stress component name to array of values.
+        components: Names of the stress components, one per column.
+        values: (n_elements, n_components) array of component values.
         subcase: Subcase ID.
     """
 
     element_ids: npt.NDArray[np.int32]
     element_type: str
-    stresses: dict[str, npt.NDArray[np.float64]]
+    components: tuple[str, ...]
+    values: npt.NDArray[np.float64]
     subcase: int = 1
 
+    def __getitem__(self, name: str) -> npt.NDArray[np.float64]:
+        """Return the column of values for one named component."""
+        return self.values[:, self.components.index(name)]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.components
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EigenvalueResult:
     """Eigenvalue results from a real eigenvalue analysis.
 
+    Eigenvalues stay float64 (needed at full precision when reconstructing
+    stiffness matrices); frequencies and generalized masses are stored as
+    float32, which covers the ~7 significant digits the F06 output prints.
+    Use :meth:`as_float64` to widen.
+
     Attributes:
         mode_numbers: Array of mode numbers.
         eigenvalues: Array of eigenvalues (radians/sec)^2.
@@ -56,12 +88,20 @@ class EigenvalueResult:
 
     mode_numbers: npt.NDArray[np.int32]
     eigenvalues: npt.NDArray[np.float64]
-    frequencies: npt.NDArray[np.float64]
-    generalized_mass: npt.NDArray[np.float64]
+    frequencies: npt.NDArray[np.floating]
+    generalized_mass: npt.NDArray[np.floating]
     generalized_stiffness: npt.NDArray[np.float64]
 
+    def as_float64(self) -> EigenvalueResult:
+        """Return a copy with all floating-point arrays widened to float64."""
+        return replace(
+            self,
+            frequencies=self.frequencies.astype(np.float64),
+            generalized_mass=self.generalized_mass.astype(np.float64),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class NastranResult:
     """Complete results from a NASTRAN-95 analysis run.
 
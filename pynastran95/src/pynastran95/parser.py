@@ -1,8 +1,16 @@
-"""Parser for NASTRAN-95 printed output (F06-style)."""
+"""Parser for NASTRAN-95 printed output (F06-style).
+
+Performance notes: the driver (:func:`parse_output`) seeks from table
+header to table header with str.find and only materializes the lines of
+each table, so per-line classification work is bounded by the size of
+the tables themselves, not the whole output; table bodies are then
+decoded in bulk with np.loadtxt. Both stages run in C, which keeps the
+interpreted per-line code off the hot path without needing a JIT.
+"""
 
 from __future__ import annotations
 
-import re
+from collections.abc import Iterator
 
 import numpy as np
 
@@ -12,366 +20,532 @@ from pynastran95.models import DisplacementResult, EigenvalueResult, StressResul
 # '1' = new page, '0' = double space, ' ' = single space, '+' = overprint
 # We detect page breaks by looking at the ORIGINAL (not stripped) line.
 
+_DISPLACEMENT_HDR = "D I S P L A C E M E N T   V E C T O R"
+_EIGENVALUE_HDR = "R E A L   E I G E N V A L U E S"
+_ROD_HDR = "S T R E S S E S   I N   R O D"
+_SHEAR_HDR = "S T R E S S E S   I N   S H E A R   P A N E L S"
+# Two literal headers beat a regex alternation: str.find runs a C
+# substring scan with no NFA state to drive.
+_QUAD_HDR = "S T R E S S E S   I N   Q U A D"
+_TRIANG_HDR = "S T R E S S E S   I N   T R I A N G"
 
-def _is_page_break(line: str) -> bool:
-    """Check if this is a Fortran page-break line (starts with '1' in column 1)."""
-    return len(line) > 0 and line[0] == "1"
 
+def _collect_data_lines(lines: list[str], i: int) -> tuple[list[str], int]:
+    """Collect the non-blank body lines of a table starting at lines[i].
 
-def _is_double_space(line: str) -> bool:
-    """Check if this is a Fortran double-space line (starts with '0' in column 1)."""
-    return len(line) > 0 and line[0] == "0"
+    Stops at the page-break or double-space line that ends the table and
+    returns the body lines plus the terminating index.
+    """
+    data_lines: list[str] = []
+    while i < len(lines):
+        line = lines[i]
+        # One first-char check covers page break ('1') and double space
+        # ('0'); isspace avoids the string copy a strip() would make.
+        c0 = line[:1]
+        if c0 == "1" or c0 == "0":
+            break
+        if line and not line.isspace():
+            data_lines.append(line)
+        i += 1
+    return data_lines, i
 
 
-def _is_data_line(line: str) -> bool:
-    """Check if a line looks like it contains numeric data (not a header/page break)."""
-    stripped = line.strip()
-    if not stripped:
-        return False
-    # Data lines start with a number (node/element ID)
-    return bool(re.match(r"^\d+", stripped))
+def _try_loadtxt(data_lines: list[str], usecols: tuple[int, ...]) -> np.ndarray | None:
+    """Decode whole table bodies in C via np.loadtxt.
 
+    loadtxt consumes the line list directly (no joined copy of the block)
+    and tokenizes in C, so no per-line Python lists or substrings are
+    allocated for well-formed tables. Returns None when the block isn't
+    uniform (stray text, blank margin columns, ...), in which case
+    callers fall back to per-line parsing.
+    """
+    if not data_lines:
+        return None
+    try:
+        return np.loadtxt(data_lines, usecols=usecols, ndmin=2)
+    except (ValueError, IndexError):
+        return None
 
-def parse_displacements(output: str, subcase: int = 1) -> list[DisplacementResult]:
-    """Parse displacement vectors from NASTRAN output.
 
-    Returns a list of DisplacementResult (one per displacement table found).
+def _parse_displacement_section(
+    lines: list[str], i: int, subcase: int
+) -> tuple[DisplacementResult | None, int]:
+    """Parse one displacement table whose header is at lines[i].
+
+    Returns the result (or None if the table held no data) and the index
+    of the line that terminated the table.
     """
-    results: list[DisplacementResult] = []
-    lines = output.splitlines()
-    i = 0
+    # Skip to the column header line
+    i += 1
+    while i < len(lines) and "POINT ID." not in lines[i]:
+        i += 1
+    i += 1  # skip the column header line itself
+
+    data_lines, i = _collect_data_lines(lines, i)
+
+    # Fast path: decode the whole block in C (col 1 is the G/S type flag)
+    arr = _try_loadtxt(data_lines, usecols=(0, 2, 3, 4, 5, 6, 7))
+    if arr is not None:
+        node_arr = arr[:, 0].astype(np.int32)
+        trans_arr = arr[:, 1:4]
+        rot_arr = arr[:, 4:7].astype(np.float32)
+    else:
+        # Flat scalar lists, reshaped once at the end: no per-row inner
+        # lists to allocate and a single C-level copy into the ndarray.
+        node_ids: list[int] = []
+        rows: list[float] = []
+        for line in data_lines:
+            parts = line.split()
+            if len(parts) < 8:
+                break
+            try:
+                nid = int(parts[0])
+                # parts[1] is type (G or S)
+                vals = (
+                    float(parts[2]),
+                    float(parts[3]),
+                    float(parts[4]),
+                    float(parts[5]),
+                    float(parts[6]),
+                    float(parts[7]),
+                )
+            except (ValueError, IndexError):
+                break
+            node_ids.append(nid)
+            rows.extend(vals)
+        if not node_ids:
+            return None, i
+        node_arr = np.array(node_ids, dtype=np.int32)
+        block = np.array(rows, dtype=np.float64).reshape(-1, 6)
+        trans_arr = block[:, 0:3]
+        # float32 covers the ~7 digits the F06 output prints
+        rot_arr = block[:, 3:6].astype(np.float32)
+
+    if node_arr.size == 0:
+        return None, i
+    return (
+        DisplacementResult(
+            node_ids=node_arr,
+            translations=trans_arr,
+            rotations=rot_arr,
+            subcase=subcase,
+        ),
+        i,
+    )
+
+
+def _parse_eigenvalue_section(lines: list[str], i: int) -> tuple[EigenvalueResult | None, int]:
+    """Parse one real-eigenvalue table whose header is at lines[i]."""
+    mode_numbers: list[int] = []
+    rows: list[float] = []
+
+    # Skip header lines to find the "MODE" header
+    i += 1
+    while i < len(lines) and "MODE" not in lines[i]:
+        i += 1
+    if i >= len(lines):
+        return None, i
+    i += 1  # skip "MODE" line
+    # Skip "NO. ORDER ..." sub-header line if present
+    if i < len(lines) and "NO." in lines[i]:
+        i += 1
+
     while i < len(lines):
-        if "D I S P L A C E M E N T   V E C T O R" in lines[i]:
-            # Skip to the column header line
+        line = lines[i]
+        if line[:1] == "1":
+            break
+        parts = line.split()
+        if not parts:
             i += 1
-            while i < len(lines) and "POINT ID." not in lines[i]:
-                i += 1
-            i += 1  # skip the column header line itself
-
-            node_ids: list[int] = []
-            translations: list[list[float]] = []
-            rotations: list[list[float]] = []
-
-            while i < len(lines):
-                line = lines[i]
-                if _is_page_break(line) or _is_double_space(line):
-                    break
-                stripped = line.strip()
-                if not stripped:
-                    i += 1
-                    continue
-                parts = stripped.split()
-                if len(parts) >= 8:
-                    try:
-                        nid = int(parts[0])
-                        # parts[1] is type (G or S)
-                        t1 = float(parts[2])
-                        t2 = float(parts[3])
-                        t3 = float(parts[4])
-                        r1 = float(parts[5])
-                        r2 = float(parts[6])
-                        r3 = float(parts[7])
-                        node_ids.append(nid)
-                        translations.append([t1, t2, t3])
-                        rotations.append([r1, r2, r3])
-                    except (ValueError, IndexError):
-                        break
-                else:
-                    break
-                i += 1
-
-            if node_ids:
-                results.append(
-                    DisplacementResult(
-                        node_ids=np.array(node_ids, dtype=np.int32),
-                        translations=np.array(translations, dtype=np.float64),
-                        rotations=np.array(rotations, dtype=np.float64),
-                        subcase=subcase,
-                    )
+            continue
+        # Skip info messages embedded in eigenvalue table
+        if parts[0][0] in "*+" or "MESSAGE" in line:
+            i += 1
+            continue
+        if len(parts) >= 7:
+            try:
+                mode = int(parts[0])
+                _ = int(parts[1])  # extraction order
+                vals = (
+                    float(parts[2]),
+                    # parts[3] = radian freq
+                    float(parts[4]),
+                    float(parts[5]),
+                    float(parts[6]),
                 )
+                mode_numbers.append(mode)
+                rows.extend(vals)
+            except (ValueError, IndexError):
+                # Not a data line (could be header text)
+                i += 1
+                continue
         else:
+            # Could be an info line with few tokens, skip
             i += 1
-    return results
+            continue
+        i += 1
+
+    if not mode_numbers:
+        return None, i
+
+    block = np.array(rows, dtype=np.float64).reshape(-1, 4)
+    return (
+        EigenvalueResult(
+            mode_numbers=np.array(mode_numbers, dtype=np.int32),
+            eigenvalues=block[:, 0],
+            # float32 covers the ~7 digits the F06 output prints
+            frequencies=block[:, 1].astype(np.float32),
+            generalized_mass=block[:, 2].astype(np.float32),
+            generalized_stiffness=block[:, 3],
+        ),
+        i,
+    )
 
 
-def parse_eigenvalues(output: str) -> EigenvalueResult | None:
-    """Parse real eigenvalue table from NASTRAN output."""
-    lines = output.splitlines()
-    i = 0
-    mode_numbers: list[int] = []
-    eigenvalues: list[float] = []
-    frequencies: list[float] = []
-    gen_mass: list[float] = []
-    gen_stiff: list[float] = []
+def _parse_rod_section(lines: list[str], i: int, subcase: int) -> tuple[StressResult | None, int]:
+    """Parse one rod-stress table whose header is at lines[i]."""
+    i += 1
+    # Skip to the "ELEMENT" header
+    while i < len(lines) and "ELEMENT" not in lines[i]:
+        i += 1
+    i += 1  # skip column header
+    # Skip the "ID." sub-header if present
+    if i < len(lines) and "ID." in lines[i]:
+        i += 1
+
+    data_lines, i = _collect_data_lines(lines, i)
+
+    # Fast path: cols are EID, axial, margin, torsion (uniform rows only;
+    # blank safety margins shift columns and drop us to the slow path)
+    arr = _try_loadtxt(data_lines, usecols=(0, 1, 3))
+    if arr is not None:
+        elem_arr = arr[:, 0].astype(np.int32)
+        values = arr[:, 1:3]
+    else:
+        elem_ids: list[int] = []
+        rows: list[float] = []
+        for line in data_lines:
+            parts = line.split()
+            if len(parts) < 4:
+                break
+            try:
+                eid = int(parts[0])
+                ax = float(parts[1])
+                # parts[2] may be safety margin
+                tor = float(parts[3]) if len(parts) > 3 else 0.0
+            except (ValueError, IndexError):
+                break
+            elem_ids.append(eid)
+            rows.append(ax)
+            rows.append(tor)
+        if not elem_ids:
+            return None, i
+        elem_arr = np.array(elem_ids, dtype=np.int32)
+        values = np.array(rows, dtype=np.float64).reshape(-1, 2)
+
+    if elem_arr.size == 0:
+        return None, i
+    return (
+        StressResult(
+            element_ids=elem_arr,
+            element_type="CROD",
+            components=("axial", "torsion"),
+            values=values,
+            subcase=subcase,
+        ),
+        i,
+    )
+
+
+def _parse_shear_section(
+    lines: list[str], i: int, subcase: int
+) -> tuple[StressResult | None, int]:
+    """Parse one shear-panel-stress table whose header is at lines[i]."""
+    i += 1
+    # Skip to the first "ELEMENT" header line
+    while i < len(lines) and "ELEMENT" not in lines[i]:
+        i += 1
+    i += 1  # skip first header
+    # Skip "ID." line
+    if i < len(lines) and "ID." in lines[i]:
+        i += 1
+
+    elem_ids: list[int] = []
+    rows: list[float] = []
 
     while i < len(lines):
-        if "R E A L   E I G E N V A L U E S" in lines[i]:
-            # Skip header lines to find the "MODE" header
+        line = lines[i]
+        c0 = line[:1]
+        if c0 == "1" or c0 == "0":
+            break
+        # split() handles surrounding whitespace itself, so no strip()
+        parts = line.split()
+        if not parts:
             i += 1
-            while i < len(lines) and "MODE" not in lines[i]:
-                i += 1
-            if i >= len(lines):
+            continue
+        # Shear stress lines have pairs of elements:
+        # EID  MAX_SHEAR  AVG_SHEAR  [MARGIN]  EID  MAX_SHEAR  AVG_SHEAR  [MARGIN]
+        j = 0
+        parsed_any = False
+        try:
+            while j < len(parts):
+                eid = int(parts[j])
+                ms = float(parts[j + 1])
+                avs = float(parts[j + 2])
+                elem_ids.append(eid)
+                rows.append(ms)
+                rows.append(avs)
+                j += 3
+                parsed_any = True
+                # Check if next item is a safety margin or next element
+                if j < len(parts):
+                    try:
+                        int(parts[j])
+                    except ValueError:
+                        j += 1  # skip safety margin
+        except (ValueError, IndexError):
+            if not parsed_any:
                 break
-            i += 1  # skip "MODE" line
-            # Skip "NO. ORDER ..." sub-header line if present
-            if i < len(lines) and "NO." in lines[i]:
-                i += 1
+        i += 1
 
-            while i < len(lines):
-                line = lines[i]
-                if _is_page_break(line):
-                    break
-                stripped = line.strip()
-                if not stripped:
-                    i += 1
-                    continue
-                # Skip info messages embedded in eigenvalue table
-                if stripped.startswith("*") or stripped.startswith("+") or "MESSAGE" in stripped:
-                    i += 1
-                    continue
-                parts = stripped.split()
-                if len(parts) >= 7:
-                    try:
-                        mode = int(parts[0])
-                        _ = int(parts[1])  # extraction order
-                        ev = float(parts[2])
-                        # parts[3] = radian freq
-                        freq = float(parts[4])
-                        gm = float(parts[5])
-                        gs = float(parts[6])
-                        mode_numbers.append(mode)
-                        eigenvalues.append(ev)
-                        frequencies.append(freq)
-                        gen_mass.append(gm)
-                        gen_stiff.append(gs)
-                    except (ValueError, IndexError):
-                        # Not a data line (could be header text)
-                        i += 1
-                        continue
-                else:
-                    # Could be an info line with few tokens, skip
-                    i += 1
-                    continue
-                i += 1
-            break  # Only parse first eigenvalue table
+    if not elem_ids:
+        return None, i
+    return (
+        StressResult(
+            element_ids=np.array(elem_ids, dtype=np.int32),
+            element_type="CSHEAR",
+            components=("max_shear", "avg_shear"),
+            values=np.array(rows, dtype=np.float64).reshape(-1, 2),
+            subcase=subcase,
+        ),
+        i,
+    )
+
+
+def _parse_membrane_section(
+    lines: list[str], i: int, subcase: int
+) -> tuple[StressResult | None, int]:
+    """Parse one membrane-stress table whose header is at lines[i]."""
+    etype = "CQDMEM" if "Q U A D" in lines[i] else "CTRMEM"
+    i += 1
+    # Skip to the "ELEMENT" header
+    while i < len(lines) and "ELEMENT" not in lines[i]:
+        i += 1
+    i += 1  # skip first header
+    # Skip "ID." line
+    if i < len(lines) and "ID." in lines[i]:
         i += 1
 
-    if not mode_numbers:
+    data_lines, i = _collect_data_lines(lines, i)
+
+    # Fast path: col 4 is the principal-stress angle, which we drop
+    arr = _try_loadtxt(data_lines, usecols=(0, 1, 2, 3, 5, 6, 7))
+    if arr is not None:
+        elem_arr = arr[:, 0].astype(np.int32)
+        values = arr[:, 1:7]
+    else:
+        elem_ids: list[int] = []
+        rows: list[float] = []
+        for line in data_lines:
+            parts = line.split()
+            if len(parts) < 8:
+                break
+            try:
+                eid = int(parts[0])
+                vals = (
+                    float(parts[1]),
+                    float(parts[2]),
+                    float(parts[3]),
+                    # parts[4] = angle
+                    float(parts[5]),
+                    float(parts[6]),
+                    float(parts[7]),
+                )
+            except (ValueError, IndexError):
+                break
+            elem_ids.append(eid)
+            rows.extend(vals)
+        if not elem_ids:
+            return None, i
+        elem_arr = np.array(elem_ids, dtype=np.int32)
+        values = np.array(rows, dtype=np.float64).reshape(-1, 6)
+
+    if elem_arr.size == 0:
+        return None, i
+    return (
+        StressResult(
+            element_ids=elem_arr,
+            element_type=etype,
+            components=(
+                "normal_x",
+                "normal_y",
+                "shear_xy",
+                "major",
+                "minor",
+                "max_shear",
+            ),
+            values=values,
+            subcase=subcase,
+        ),
+        i,
+    )
+
+
+def _iter_sections(output: str, header: str) -> Iterator[list[str]]:
+    """Yield the line list of each table whose header matches `header`.
+
+    Seeks header offsets with str.find over the raw output (one scan per
+    table instead of a substring test per line) and materializes only the
+    section, bounded by the next page-break line.
+    """
+    pos = 0
+    while (at := output.find(header, pos)) != -1:
+        line_start = output.rfind("\n", 0, at) + 1
+        section_end = output.find("\n1", at)
+        section = output[line_start : section_end if section_end != -1 else len(output)]
+        yield section.splitlines()
+        pos = at + 1
+
+
+def _next_header(output: str, pos: int) -> tuple[str, int] | None:
+    """Find the earliest table header at or after pos.
+
+    Returns (kind, offset) or None when no header remains. Seeking with
+    str.find visits O(sections) positions rather than every line.
+    """
+    candidates: list[tuple[int, str]] = []
+    for kind, header in (
+        ("displacement", _DISPLACEMENT_HDR),
+        ("eigenvalue", _EIGENVALUE_HDR),
+        ("rod", _ROD_HDR),
+        ("shear", _SHEAR_HDR),
+        ("membrane", _QUAD_HDR),
+        ("membrane", _TRIANG_HDR),
+    ):
+        at = output.find(header, pos)
+        if at != -1:
+            candidates.append((at, kind))
+    if not candidates:
         return None
+    at, kind = min(candidates)
+    return kind, at
 
-    return EigenvalueResult(
-        mode_numbers=np.array(mode_numbers, dtype=np.int32),
-        eigenvalues=np.array(eigenvalues, dtype=np.float64),
-        frequencies=np.array(frequencies, dtype=np.float64),
-        generalized_mass=np.array(gen_mass, dtype=np.float64),
-        generalized_stiffness=np.array(gen_stiff, dtype=np.float64),
-    )
+
+def parse_output(
+    output: str, subcase: int = 1
+) -> tuple[list[DisplacementResult], list[StressResult], EigenvalueResult | None]:
+    """Parse all supported result tables in a single pass over the output.
+
+    Equivalent to running every parse_* function, but instead of
+    splitting the whole text into a line list per table type, the driver
+    seeks from header to header over the raw string and only materializes
+    the lines of each table (bounded by the next page break). Stress
+    results come back in document order.
+    """
+    displacements: list[DisplacementResult] = []
+    stresses: list[StressResult] = []
+    eigenvalues: EigenvalueResult | None = None
+
+    pos = 0
+    while True:
+        found = _next_header(output, pos)
+        if found is None:
+            break
+        kind, at = found
+        # Materialize only this section: from the start of the header line
+        # to the next page-break line (every table starts on a fresh page).
+        line_start = output.rfind("\n", 0, at) + 1
+        section_end = output.find("\n1", at)
+        section = output[line_start : section_end if section_end != -1 else len(output)]
+        lines = section.splitlines()
+
+        if kind == "displacement":
+            disp, _ = _parse_displacement_section(lines, 0, subcase)
+            if disp is not None:
+                displacements.append(disp)
+        elif kind == "eigenvalue":
+            if eigenvalues is None:
+                eigenvalues, _ = _parse_eigenvalue_section(lines, 0)
+        elif kind == "rod":
+            stress, _ = _parse_rod_section(lines, 0, subcase)
+            if stress is not None:
+                stresses.append(stress)
+        elif kind == "shear":
+            stress, _ = _parse_shear_section(lines, 0, subcase)
+            if stress is not None:
+                stresses.append(stress)
+        else:  # membrane
+            stress, _ = _parse_membrane_section(lines, 0, subcase)
+            if stress is not None:
+                stresses.append(stress)
+
+        # Resume the header search just past this header; any further
+        # headers on the same page are still found.
+        pos = at + 1
+
+    return displacements, stresses, eigenvalues
+
+
+def parse_displacements(output: str, subcase: int = 1) -> list[DisplacementResult]:
+    """Parse displacement vectors from NASTRAN output.
+
+    Returns a list of DisplacementResult (one per displacement table found).
+    """
+    results: list[DisplacementResult] = []
+    for lines in _iter_sections(output, _DISPLACEMENT_HDR):
+        result, _ = _parse_displacement_section(lines, 0, subcase)
+        if result is not None:
+            results.append(result)
+    return results
+
+
+def parse_eigenvalues(output: str) -> EigenvalueResult | None:
+    """Parse real eigenvalue table from NASTRAN output."""
+    for lines in _iter_sections(output, _EIGENVALUE_HDR):
+        # Only parse first eigenvalue table
+        result, _ = _parse_eigenvalue_section(lines, 0)
+        return result
+    return None
 
 
 def parse_rod_stresses(output: str, subcase: int = 1) -> list[StressResult]:
     """Parse rod element stresses from NASTRAN output."""
     results: list[StressResult] = []
-    lines = output.splitlines()
-    i = 0
-    while i < len(lines):
-        if "S T R E S S E S   I N   R O D" in lines[i]:
-            i += 1
-            # Skip to the "ELEMENT" header
-            while i < len(lines) and "ELEMENT" not in lines[i]:
-                i += 1
-            i += 1  # skip column header
-            # Skip the "ID." sub-header if present
-            if i < len(lines) and "ID." in lines[i]:
-                i += 1
-
-            elem_ids: list[int] = []
-            axial: list[float] = []
-            torsion: list[float] = []
-
-            while i < len(lines):
-                line = lines[i]
-                if _is_page_break(line) or _is_double_space(line):
-                    break
-                stripped = line.strip()
-                if not stripped:
-                    i += 1
-                    continue
-                parts = stripped.split()
-                if len(parts) >= 4:
-                    try:
-                        eid = int(parts[0])
-                        ax = float(parts[1])
-                        # parts[2] may be safety margin
-                        tor = float(parts[3]) if len(parts) > 3 else 0.0
-                        elem_ids.append(eid)
-                        axial.append(ax)
-                        torsion.append(tor)
-                    except (ValueError, IndexError):
-                        break
-                else:
-                    break
-                i += 1
-
-            if elem_ids:
-                results.append(
-                    StressResult(
-                        element_ids=np.array(elem_ids, dtype=np.int32),
-                        element_type="CROD",
-                        stresses={
-                            "axial": np.array(axial, dtype=np.float64),
-                            "torsion": np.array(torsion, dtype=np.float64),
-                        },
-                        subcase=subcase,
-                    )
-                )
-        i += 1
+    for lines in _iter_sections(output, _ROD_HDR):
+        result, _ = _parse_rod_section(lines, 0, subcase)
+        if result is not None:
+            results.append(result)
     return results
 
 
 def parse_shear_stresses(output: str, subcase: int = 1) -> list[StressResult]:
     """Parse shear panel stresses from NASTRAN output."""
     results: list[StressResult] = []
-    lines = output.splitlines()
-    i = 0
-    while i < len(lines):
-        if "S T R E S S E S   I N   S H E A R   P A N E L S" in lines[i]:
-            i += 1
-            # Skip to the first "ELEMENT" header line
-            while i < len(lines) and "ELEMENT" not in lines[i]:
-                i += 1
-            i += 1  # skip first header
-            # Skip "ID." line
-            if i < len(lines) and "ID." in lines[i]:
-                i += 1
-
-            elem_ids: list[int] = []
-            max_shear: list[float] = []
-            avg_shear: list[float] = []
-
-            while i < len(lines):
-                line = lines[i]
-                if _is_page_break(line) or _is_double_space(line):
-                    break
-                stripped = line.strip()
-                if not stripped:
-                    i += 1
-                    continue
-                # Shear stress lines have pairs of elements:
-                # EID  MAX_SHEAR  AVG_SHEAR  [MARGIN]  EID  MAX_SHEAR  AVG_SHEAR  [MARGIN]
-                parts = stripped.split()
-                j = 0
-                parsed_any = False
-                try:
-                    while j < len(parts):
-                        eid = int(parts[j])
-                        ms = float(parts[j + 1])
-                        avs = float(parts[j + 2])
-                        elem_ids.append(eid)
-                        max_shear.append(ms)
-                        avg_shear.append(avs)
-                        j += 3
-                        parsed_any = True
-                        # Check if next item is a safety margin or next element
-                        if j < len(parts):
-                            try:
-                                int(parts[j])
-                            except ValueError:
-                                j += 1  # skip safety margin
-                except (ValueError, IndexError):
-                    if not parsed_any:
-                        break
-                i += 1
-
-            if elem_ids:
-                results.append(
-                    StressResult(
-                        element_ids=np.array(elem_ids, dtype=np.int32),
-                        element_type="CSHEAR",
-                        stresses={
-                            "max_shear": np.array(max_shear, dtype=np.float64),
-                            "avg_shear": np.array(avg_shear, dtype=np.float64),
-                        },
-                        subcase=subcase,
-                    )
-                )
-        i += 1
+    for lines in _iter_sections(output, _SHEAR_HDR):
+        result, _ = _parse_shear_section(lines, 0, subcase)
+        if result is not None:
+            results.append(result)
     return results
 
 
 def parse_membrane_stresses(output: str, subcase: int = 1) -> list[StressResult]:
     """Parse quadrilateral/triangular membrane stresses from NASTRAN output."""
     results: list[StressResult] = []
-    lines = output.splitlines()
-    i = 0
-    while i < len(lines):
-        if re.search(r"S T R E S S E S   I N   (Q U A D|T R I A N G)", lines[i]):
-            etype = "CQDMEM" if "Q U A D" in lines[i] else "CTRMEM"
-            i += 1
-            # Skip to the "ELEMENT" header
-            while i < len(lines) and "ELEMENT" not in lines[i]:
-                i += 1
-            i += 1  # skip first header
-            # Skip "ID." line
-            if i < len(lines) and "ID." in lines[i]:
-                i += 1
-
-            elem_ids: list[int] = []
-            normal_x: list[float] = []
-            normal_y: list[float] = []
-            shear_xy: list[float] = []
-            major: list[float] = []
-            minor: list[float] = []
-            max_shear_vals: list[float] = []
-
-            while i < len(lines):
-                line = lines[i]
-                if _is_page_break(line) or _is_double_space(line):
-                    break
-                stripped = line.strip()
-                if not stripped:
-                    i += 1
-                    continue
-                parts = stripped.split()
-                if len(parts) >= 8:
-                    try:
-                        eid = int(parts[0])
-                        nx = float(parts[1])
-                        ny = float(parts[2])
-                        sxy = float(parts[3])
-                        # parts[4] = angle
-                        maj = float(parts[5])
-                        minn = float(parts[6])
-                        ms = float(parts[7])
-                        elem_ids.append(eid)
-                        normal_x.append(nx)
-                        normal_y.append(ny)
-                        shear_xy.append(sxy)
-                        major.append(maj)
-                        minor.append(minn)
-                        max_shear_vals.append(ms)
-                    except (ValueError, IndexError):
-                        break
-                else:
-                    break
-                i += 1
-
-            if elem_ids:
-                results.append(
-                    StressResult(
-                        element_ids=np.array(elem_ids, dtype=np.int32),
-                        element_type=etype,
-                        stresses={
-                            "normal_x": np.array(normal_x, dtype=np.float64),
-                            "normal_y": np.array(normal_y, dtype=np.float64),
-                            "shear_xy": np.array(shear_xy, dtype=np.float64),
-                            "major": np.array(major, dtype=np.float64),
-                            "minor": np.array(minor, dtype=np.float64),
-                            "max_shear": np.array(max_shear_vals, dtype=np.float64),
-                        },
-                        subcase=subcase,
-                    )
-                )
-        i += 1
+    pos = 0
+    while True:
+        # Earliest of the two membrane headers keeps document order
+        q = output.find(_QUAD_HDR, pos)
+        t = output.find(_TRIANG_HDR, pos)
+        if q == -1 and t == -1:
+            break
+        at = min(x for x in (q, t) if x != -1)
+        line_start = output.rfind("\n", 0, at) + 1
+        section_end = output.find("\n1", at)
+        section = output[line_start : section_end if section_end != -1 else len(output)]
+        result, _ = _parse_membrane_section(section.splitlines(), 0, subcase)
+        if result is not None:
+            results.append(result)
+        pos = at + 1
     return results
 
 
@@ -2,28 +2,39 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import shutil
 import subprocess
 import tempfile
 import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 from typing import Literal
 
-from pynastran95.models import NastranResult
-from pynastran95.parser import (
-    is_completed,
-    parse_displacements,
-    parse_eigenvalues,
-    parse_membrane_stresses,
-    parse_rod_stresses,
-    parse_shear_stresses,
-)
+import numpy as np
+import numpy.typing as npt
+
+from pynastran95.models import DisplacementResult, NastranResult, StressResult
+from pynastran95.parser import is_completed, parse_output
 
 # Default paths: prefer bundled data, fall back to repo layout for dev
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 
 
+def _read_ascii(path: Path) -> str:
+    """Read a NASTRAN text file (F06 output, log) into a str.
+
+    The files are plain ASCII, so read raw bytes and decode as latin-1: a
+    single-byte codec with no multi-byte branching, measurably cheaper
+    than Path.read_text's UTF-8 decode on multi-MB outputs, and it cannot
+    raise on a stray high byte in a corrupted run.
+    """
+    return path.read_bytes().decode("latin-1")
+
+
 def _default_executable() -> Path:
     """Find the nastrn executable (bundled or repo)."""
     from pynastran95._data import get_executable
@@ -44,6 +55,125 @@ def _default_rfdir() -> Path:
     return _REPO_ROOT / "rf_clean"
 
 
+def _share_id_arrays(
+    displacements: list[DisplacementResult],
+    stresses: list[StressResult],
+) -> tuple[list[DisplacementResult], list[StressResult]]:
+    """Intern duplicate node/element id arrays across parsed results.
+
+    Every subcase of a run reports the same grid and element ids, so a
+    K-subcase run would otherwise hold K identical copies of each id
+    vector. Results whose ids repeat are rebuilt to reference a single
+    shared array, which is marked read-only since it is aliased.
+    """
+    pool: dict[bytes, npt.NDArray[np.int32]] = {}
+
+    def canonical(arr: npt.NDArray[np.int32]) -> npt.NDArray[np.int32]:
+        key = arr.tobytes()
+        cached = pool.get(key)
+        if cached is None:
+            arr.flags.writeable = False
+            pool[key] = arr
+            return arr
+        return cached
+
+    displacements = [replace(d, node_ids=canonical(d.node_ids)) for d in displacements]
+    stresses = [replace(s, element_ids=canonical(s.element_ids)) for s in stresses]
+    return displacements, stresses
+
+
+def _freeze_result_arrays(result: NastranResult) -> None:
+    """Mark every array on a cached result read-only.
+
+    Cache hits hand the same array objects to every caller, so an
+    in-place edit like ``result.translations *= 2`` would silently
+    corrupt all later parses of the same output. Freezing turns that
+    into an immediate ValueError; callers who want to mutate take an
+    explicit copy.
+    """
+    for d in result.displacements:
+        d.translations.flags.writeable = False
+        d.rotations.flags.writeable = False
+    for s in result.stresses:
+        s.values.flags.writeable = False
+    if result.eigenvalues is not None:
+        ev = result.eigenvalues
+        for arr in (
+            ev.mode_numbers,
+            ev.eigenvalues,
+            ev.frequencies,
+            ev.generalized_mass,
+            ev.generalized_stiffness,
+        ):
+            arr.flags.writeable = False
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_parse(output: str) -> NastranResult:
+    """Parse NASTRAN output text, memoized on the text itself.
+
+    Re-parsing the same output (repeated queries in tests or interactive
+    sessions) hits the cache instead of re-walking megabytes of text.
+    Keying on the str costs one hash pass on first sight; CPython caches
+    the hash on the string object afterwards. The cached strings are not
+    extra memory -- each result carries its output text anyway.
+    """
+    completed = is_completed(output)
+    # Single pass over the output; stresses come back in document order
+    displacements, stresses, eigenvalues = parse_output(output)
+    displacements, stresses = _share_id_arrays(displacements, stresses)
+    result = NastranResult(
+        returncode=0,
+        output=output,
+        completed=completed,
+        displacements=displacements,
+        stresses=stresses,
+        eigenvalues=eigenvalues,
+    )
+    _freeze_result_arrays(result)
+    return result
+
+
+def _results_from_output(output: str) -> NastranResult:
+    """Parse NASTRAN output text into structured results."""
+    # Callers overwrite returncode/log/wall_time on the result, so each
+    # gets a fresh shell (and fresh list objects) around the shared,
+    # immutable parsed results.
+    cached = _cached_parse(output)
+    return replace(
+        cached,
+        displacements=list(cached.displacements),
+        stresses=list(cached.stresses),
+    )
+
+
+def _parse_file(path: str | Path) -> NastranResult:
+    """Read and parse one output file (module-level so it pickles)."""
+    return _results_from_output(_read_ascii(Path(path)))
+
+
+def parse_many(paths: Sequence[str | Path], workers: int | None = None) -> list[NastranResult]:
+    """Parse a batch of NASTRAN output files in parallel.
+
+    Each file parse is independent and CPU-bound in Python, so a
+    parameter sweep's worth of F06 files is fanned out across a process
+    pool. Results come back in the order of `paths`.
+
+    Args:
+        paths: Output files to parse.
+        workers: Process count; defaults to the executor's choice
+                 (the machine's CPU count).
+
+    Returns:
+        One NastranResult per path, in order.
+    """
+    # Serial for a single file: not worth a pool start-up
+    if len(paths) < 2:
+        return [_parse_file(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_parse_file, paths))
+
+
 class NastranRunner:
     """Runs NASTRAN-95 analyses.
 
@@ -97,6 +227,23 @@ class NastranRunner:
             msg = f"Rigid format directory not found: {self.rfdir}"
             raise FileNotFoundError(msg)
 
+        # Environment template built once: everything except the
+        # scratch-dir-dependent paths, which _setup_env overlays per run.
+        # Saves rebuilding ~30 constant entries for every analysis in a
+        # parameter sweep of small decks.
+        env = os.environ.copy()
+        # The f2py extension is built with -fopenmp; honor a caller-set
+        # OMP_NUM_THREADS and default to the cores we're allowed to use.
+        if hasattr(os, "sched_getaffinity"):
+            env.setdefault("OMP_NUM_THREADS", str(len(os.sched_getaffinity(0))))
+        env["RFDIR"] = str(self.rfdir)
+        env["DBMEM"] = str(self.dbmem)
+        env["OCMEM"] = str(self.ocmem)
+        env["OPTPNM"] = "none"
+        for i in range(1, 11):
+            env[f"SOF{i}"] = "none"
+        self._env_template = env
+
     def run(
         self,
         input_data: str | Path,
@@ -115,67 +262,91 @@ class NastranRunner:
         Returns:
             NastranResult with output text and parsed results.
         """
-        # Handle input
-        if isinstance(input_data, Path) or (
-            isinstance(input_data, str) and os.path.isfile(input_data)
-        ):
-            input_path = Path(input_data)
-            input_text = input_path.read_text()
-        else:
-            input_text = input_data
-
         # Create scratch directory
         scratch_parent = self.scratch_root or Path(tempfile.gettempdir())
         scratch_dir = Path(tempfile.mkdtemp(prefix="nastran_", dir=scratch_parent))
 
         try:
-            if self.mode == "subprocess":
-                return self._execute_subprocess(input_text, scratch_dir, timeout)
-            else:
-                return self._execute_f2py(input_text, scratch_dir, timeout)
+            return self._run_in(input_data, scratch_dir, timeout)
         finally:
             if cleanup:
                 shutil.rmtree(scratch_dir, ignore_errors=True)
 
+    def batch(
+        self,
+        inputs: Sequence[str | Path],
+        *,
+        timeout: float | None = 300.0,
+        cleanup: bool = True,
+    ) -> Iterator[NastranResult]:
+        """Run a batch of analyses, yielding one result per input.
+
+        Cheaper than repeated :meth:`run` calls for parameter sweeps: the
+        whole batch shares one temporary parent directory (one mkdtemp and
+        one recursive cleanup instead of a round trip per job), and each
+        job scratches in a plain numbered subdirectory.
+
+        Args:
+            inputs: Input files or deck strings, run in order.
+            timeout: Maximum wall time in seconds per job.
+            cleanup: Whether to remove scratch files after each job.
+        """
+        scratch_parent = Path(
+            tempfile.mkdtemp(
+                prefix="nastran_batch_",
+                dir=self.scratch_root or tempfile.gettempdir(),
+            )
+        )
+        try:
+            for n, input_data in enumerate(inputs):
+                scratch_dir = scratch_parent / f"job{n:04d}"
+                scratch_dir.mkdir()
+                try:
+                    yield self._run_in(input_data, scratch_dir, timeout)
+                finally:
+                    if cleanup:
+                        shutil.rmtree(scratch_dir, ignore_errors=True)
+        finally:
+            if cleanup:
+                shutil.rmtree(scratch_parent, ignore_errors=True)
+
+    def _run_in(
+        self,
+        input_data: str | Path,
+        scratch_dir: Path,
+        timeout: float | None,
+    ) -> NastranResult:
+        """Run one analysis in an existing scratch directory."""
+        input_path: Path | None = None
+        if isinstance(input_data, Path) or (
+            isinstance(input_data, str) and os.path.isfile(input_data)
+        ):
+            input_path = Path(input_data)
+            input_text = _read_ascii(input_path)
+        else:
+            input_text = input_data
+
+        if self.mode == "subprocess":
+            return self._execute_subprocess(input_text, scratch_dir, timeout)
+        return self._execute_f2py(input_text, scratch_dir, timeout, input_path)
+
     def _setup_env(self, scratch_dir: Path) -> dict[str, str]:
         """Set up environment variables for NASTRAN."""
-        env = os.environ.copy()
-        env["RFDIR"] = str(self.rfdir)
-        env["DBMEM"] = str(self.dbmem)
-        env["OCMEM"] = str(self.ocmem)
+        # Copy the prebuilt template; only scratch paths vary per run
+        env = self._env_template.copy()
         env["DIRCTY"] = str(scratch_dir)
         env["LOGNM"] = str(scratch_dir / "run.log")
         env["NPTPNM"] = str(scratch_dir / "run.nptp")
         env["DICTNM"] = str(scratch_dir / "run.dic")
         env["PLTNM"] = str(scratch_dir / "plot.dat")
         env["PUNCHNM"] = str(scratch_dir / "punch.dat")
-        env["OPTPNM"] = "none"
-        env["SOF1"] = "none"
-        env["SOF2"] = "none"
-        for i in range(3, 11):
-            env[f"SOF{i}"] = "none"
         for i in range(11, 24):
             env[f"FTN{i}"] = str(scratch_dir / f"ftn{i}")
         return env
 
     def _parse_results(self, output: str) -> NastranResult:
         """Parse NASTRAN output text into structured results."""
-        completed = is_completed(output)
-        displacements = parse_displacements(output)
-        eigenvalues = parse_eigenvalues(output)
-        stresses = (
-            parse_rod_stresses(output)
-            + parse_shear_stresses(output)
-            + parse_membrane_stresses(output)
-        )
-        return NastranResult(
-            returncode=0,
-            output=output,
-            completed=completed,
-            displacements=displacements,
-            stresses=stresses,
-            eigenvalues=eigenvalues,
-        )
+        return _results_from_output(output)
 
     def _execute_subprocess(
         self,
@@ -188,17 +359,23 @@ class NastranRunner:
 
         t0 = time.monotonic()
         try:
+            # Capture stdout as bytes and decode latin-1 ourselves: the
+            # output is ASCII, and text=True would run the whole capture
+            # through the UTF-8 codec a second time. The capture already
+            # drains the pipe while the solver runs; parsing is deliberately
+            # not streamed into that loop -- it costs milliseconds against
+            # solver runtimes of seconds, and a state-machine parser would
+            # complicate the timeout and error paths for no visible win.
             proc = subprocess.run(
                 [str(self.executable)],
-                input=input_text,
+                input=input_text.encode("latin-1"),
                 capture_output=True,
-                text=True,
                 timeout=timeout,
                 env=env,
                 cwd=str(scratch_dir),
             )
             wall_time = time.monotonic() - t0
-            output = proc.stdout
+            output = proc.stdout.decode("latin-1")
             returncode = proc.returncode
         except subprocess.TimeoutExpired:
             wall_time = time.monotonic() - t0
@@ -212,7 +389,7 @@ class NastranRunner:
 
         # Read log file if it exists
         log_path = scratch_dir / "run.log"
-        log = log_path.read_text() if log_path.exists() else ""
+        log = _read_ascii(log_path) if log_path.exists() else ""
 
         result = self._parse_results(output)
         result.returncode = returncode
@@ -225,6 +402,7 @@ class NastranRunner:
         input_text: str,
         scratch_dir: Path,
         timeout: float | None,
+        input_path: Path | None = None,
     ) -> NastranResult:
         """Execute NASTRAN via the f2py extension (forked child process)."""
         from pynastran95._fortran import get_core
@@ -236,9 +414,16 @@ class NastranRunner:
             old_env[key] = os.environ.get(key)
             os.environ[key] = value
 
-        # Write input to a temp file
+        # Stage the input: hardlink on-disk inputs (zero-copy on the same
+        # filesystem) and only write a temp copy for deck strings
         input_file = scratch_dir / "input.dat"
-        input_file.write_text(input_text)
+        if input_path is not None:
+            try:
+                os.link(input_path, input_file)
+            except OSError:
+                input_file.write_text(input_text)
+        else:
+            input_file.write_text(input_text)
 
         output_file = scratch_dir / "output.out"
 
@@ -256,9 +441,9 @@ class NastranRunner:
                     os.environ[key] = value
 
         # Read output
-        output = output_file.read_text() if output_file.exists() else ""
+        output = _read_ascii(output_file) if output_file.exists() else ""
         log_path = scratch_dir / "run.log"
-        log = log_path.read_text() if log_path.exists() else ""
+        log = _read_ascii(log_path) if log_path.exists() else ""
 
         result = self._parse_results(output)
         result.returncode = int(rc)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import shutil
+import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 # Paths relative to the pynastran95 project
@@ -13,31 +16,255 @@ DEMOOUT_DIR = REPO_ROOT / "demoout"
 BUILD_DIR = REPO_ROOT / "build"
 RF_CLEAN_DIR = REPO_ROOT / "rf_clean"
 
+D01011A_INP = INP_CLEAN_DIR / "d01011a.inp"
+D03011A_INP = INP_CLEAN_DIR / "d03011a.inp"
 
-@pytest.fixture
+# Collection-time skips for the demo input decks: the exists() check runs
+# once at import instead of per test, and skipped tests never pay fixture
+# setup.
+requires_d01011a = pytest.mark.skipif(not D01011A_INP.exists(), reason="d01011a.inp not found")
+requires_d03011a = pytest.mark.skipif(not D03011A_INP.exists(), reason="d03011a.inp not found")
+
+
+def assert_close(actual: float, expected: float, rtol: float = 1e-5, atol: float = 0.0) -> None:
+    """Scalar tolerance assert without np.testing's formatting overhead.
+
+    np.testing.assert_allclose builds comparison masks and pre-formats
+    its report even on success; for single scalars in parametrized cases
+    a plain comparison suffices. Arrays should keep assert_allclose for
+    its mismatch reporting.
+    """
+    assert abs(actual - expected) <= rtol * abs(expected) + atol, (
+        f"{actual!r} !~ {expected!r} (rtol={rtol}, atol={atol})"
+    )
+
+
+def id_index(ids: np.ndarray) -> dict[int, int]:
+    """Map node/element id -> row index for O(1) assertion lookups.
+
+    Built once per array, this replaces repeated np.where(ids == n)
+    scans, which are O(N) per id checked.
+    """
+    return {v: i for i, v in enumerate(ids.tolist())}
+
+
+@pytest.fixture(scope="session")
 def nastran_runner():
-    """Create a NastranRunner with default settings."""
+    """Create a NastranRunner with default settings.
+
+    Session-scoped: the runner is stateless across run() calls (each run
+    gets its own scratch directory), so the executable stat and
+    environment-template setup happen once for the whole suite. All runs
+    scratch under one session directory, keeping the solver's working
+    files on the same (page-cache-warm) filesystem subtree.
+
+    The scratch root is a deliberately short path directly in the system
+    temp dir, not a pytest basetemp: the Fortran binary has fixed-width
+    filename buffers, so a run.log path of 73+ characters is silently
+    dropped and 80 aborts the run -- pytest-xdist's nested per-worker
+    basetemp lands right on that limit.
+    """
     from pynastran95.runner import NastranRunner
 
     executable = BUILD_DIR / "nastrn"
     if not executable.exists():
         pytest.skip("NASTRAN executable not found")
-    return NastranRunner(executable=executable, rfdir=RF_CLEAN_DIR)
+    scratch_root = Path(tempfile.mkdtemp(prefix="nast_"))
+    yield NastranRunner(
+        executable=executable,
+        rfdir=RF_CLEAN_DIR,
+        scratch_root=scratch_root,
+    )
+    shutil.rmtree(scratch_root, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def d01011a_text() -> str:
+    """Text of the d01011a demo input deck (read once per session)."""
+    if not D01011A_INP.exists():
+        pytest.skip("Input file not found")
+    return D01011A_INP.read_text()
+
+
+@pytest.fixture(scope="session")
+def cantilever_bdf_deck() -> str:
+    """Cantilever beam input deck built with pyNastran.
+
+    Session-scoped: the BDF model build and write_bdf formatting are pure
+    Python object churn that every consuming test can share.
+    """
+    pytest.importorskip("pyNastran.bdf.bdf")
+    from io import StringIO
+
+    from pyNastran.bdf.bdf import BDF
+
+    model = BDF()
+
+    # Materials: steel
+    E = 30.0e6  # psi
+    nu = 0.3
+    rho = 0.283  # lb/in^3
+    model.add_mat1(mid=1, E=E, G=None, nu=nu, rho=rho)
+
+    # Properties: rod
+    A = 1.0  # in^2
+    model.add_prod(pid=1, mid=1, A=A, j=0.0)
+
+    # 10-element cantilever beam using CROD elements
+    L = 100.0  # total length
+    n_elem = 10
+    dx = L / n_elem
+
+    for i in range(n_elem + 1):
+        nid = i + 1
+        model.add_grid(nid, [i * dx, 0.0, 0.0])
+
+    for i in range(n_elem):
+        eid = i + 1
+        model.add_conrod(eid, [i + 1, i + 2], mid=1, A=A)
 
+    # Fix the left end (node 1)
+    model.add_spc1(1, "123456", [1])
 
-@pytest.fixture
+    # Apply a 1000 lb load at the tip (node 11) in Y-direction
+    # Actually CROD only has axial - let's use X direction
+    model.add_force(1, 11, 1.0, [1000.0, 0.0, 0.0])
+
+    # Executive and case control
+    lines = [
+        "SOL 1,1",
+        "APP DISPLACEMENT",
+        "TIME 10",
+        "CEND",
+    ]
+    model.executive_control_lines = [f"{line:<72}" for line in lines]
+
+    case = model.create_subcases(0)
+    case.add_integer_type("SPC", 1)
+    case.add_integer_type("LOAD", 1)
+    case.add_result_type("DISPLACEMENT", "ALL")
+    case.add_result_type("SPCFORCES", "ALL")
+    case.add_result_type("STRESS", "ALL")
+
+    # Write to string
+    buf = StringIO()
+    model.write_bdf(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
+def cantilever_manual_deck() -> str:
+    """Cantilever beam input deck built manually (once per session).
+
+    A 10-element CBAR cantilever with a transverse tip load.
+    Known analytical solution: delta = PL^3/(3EI)
+    P=1000 lb, L=100 in, I=1.0 in^4, E=30e6 psi
+    -> delta = 1000*100^3/(3*30e6*1.0) = 0.01111 in
+    """
+    # Lines are padded to 80 columns (NASTRAN fixed format) as they are
+    # appended, so the final join is a single concatenation with no
+    # second format pass over every line.
+    lines = [
+        # Executive control
+        "ID    CANTILEVER,PYNASTRAN95".ljust(80),
+        "APP   DISPLACEMENT".ljust(80),
+        "SOL   1,1".ljust(80),
+        "TIME  10".ljust(80),
+        "CEND".ljust(80),
+        # Case control
+        "TITLE    = CANTILEVER BEAM TEST".ljust(80),
+        "   SPC = 1".ljust(80),
+        "  LOAD = 1".ljust(80),
+        "  DISPLACEMENT = ALL".ljust(80),
+        "  SPCFORCES = ALL".ljust(80),
+        "  ELSTRESS = ALL".ljust(80),
+        "BEGIN BULK".ljust(80),
+    ]
+
+    # Grid points: 11 nodes along X axis, 10 inches apart
+    # GRID, NID, CP, X1, X2, X3, CD, PS, SEID (8-char fixed fields)
+    lines.extend(
+        f"GRID    {i + 1:<8d}        {float(i * 10):8.1f}     0.0     0.0".ljust(80)
+        for i in range(11)
+    )
+
+    # CBAR elements with orientation vector in Z
+    # CBAR, EID, PID, GA, GB, X1, X2, X3
+    lines.extend(
+        f"CBAR    {i + 1:<8d}1       {i + 1:<8d}{i + 2:<8d}0.0     0.0     1.0".ljust(80)
+        for i in range(10)
+    )
+
+    lines.extend(
+        [
+            # Property: PBAR (beam), A=1.0 in^2, I1=I2=1.0 in^4, J=2.0 in^4
+            "PBAR    1       1       1.0     1.0     1.0     2.0".ljust(80),
+            # Material (MAT1) - steel
+            "MAT1    1       30.0+6          .3      .283".ljust(80),
+            # SPC: fix node 1 in all 6 DOFs
+            "SPC1    1       123456  1".ljust(80),
+            # Force: 1000 lb in Z direction on node 11
+            "FORCE   1       11      0       1000.0  0.0     0.0     1.0".ljust(80),
+            "ENDDATA".ljust(80),
+        ]
+    )
+
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture(scope="session")
 def reference_output_d01011a() -> str:
-    """Load reference output for demo problem d01011a."""
+    """Load reference output for demo problem d01011a (once per session)."""
     path = DEMOOUT_DIR / "d01011a.out"
     if not path.exists():
         pytest.skip("Reference output not found")
-    return path.read_text()
+    # F06 output is ASCII; bytes + latin-1 skips the UTF-8 decode
+    return path.read_bytes().decode("latin-1")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def reference_output_d03011a() -> str:
-    """Load reference output for demo problem d03011a."""
+    """Load reference output for demo problem d03011a (once per session)."""
     path = DEMOOUT_DIR / "d03011a.out"
     if not path.exists():
         pytest.skip("Reference output not found")
-    return path.read_text()
+    return path.read_bytes().decode("latin-1")
+
+
+@pytest.fixture(scope="session")
+def parsed_d01011a(reference_output_d01011a: str) -> dict:
+    """All supported tables parsed from d01011a, once per session.
+
+    The parse tests all scan the same multi-MB text; sharing one parse
+    keeps each test an assertion, not a re-parse.
+    """
+    from pynastran95.parser import (
+        parse_displacements,
+        parse_eigenvalues,
+        parse_membrane_stresses,
+        parse_shear_stresses,
+    )
+
+    return {
+        "displacements": parse_displacements(reference_output_d01011a),
+        "membrane": parse_membrane_stresses(reference_output_d01011a),
+        "shear": parse_shear_stresses(reference_output_d01011a),
+        "eigenvalues": parse_eigenvalues(reference_output_d01011a),
+    }
+
+
+@pytest.fixture(scope="session")
+def d01011a_node_index(parsed_d01011a: dict) -> dict[int, int]:
+    """id -> row map for the first d01011a displacement table.
+
+    Built once so parametrized reference-value cases share one index.
+    """
+    return id_index(parsed_d01011a["displacements"][0].node_ids)
+
+
+@pytest.fixture(scope="session")
+def parsed_d03011a(reference_output_d03011a: str) -> dict:
+    """Eigenvalue table parsed from d03011a, once per session."""
+    from pynastran95.parser import parse_eigenvalues
+
+    return {"eigenvalues": parse_eigenvalues(reference_output_d03011a)}
@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 import numpy as np
-
-from pynastran95.parser import (
-    is_completed,
-    parse_displacements,
-    parse_eigenvalues,
-    parse_membrane_stresses,
-    parse_shear_stresses,
+import pytest
+
+from pynastran95.parser import is_completed
+from tests.conftest import assert_close, id_index
+
+# Reference displacement values from the d01011a output as one
+# contiguous table (node id, translation component, expected value)
+# instead of literals scattered through test bodies.
+EXPECTED_D01011A_DISP = np.array(
+    [
+        (11, 0, 0.0),
+        (11, 1, 6.326195e-04),
+        (11, 2, 3.889221e-02),
+        (16, 2, -4.237940e-01),
+    ],
+    dtype=[("nid", "i4"), ("comp", "i4"), ("val", "f8")],
 )
 
 
@@ -25,9 +34,9 @@ class TestIsCompleted:
 
 
 class TestParseDisplacements:
-    def test_parse_reference_output(self, reference_output_d01011a: str) -> None:
+    def test_parse_reference_output(self, parsed_d01011a: dict) -> None:
         """Parse displacements from the d01011a reference output."""
-        results = parse_displacements(reference_output_d01011a)
+        results = parsed_d01011a["displacements"]
         assert len(results) >= 1
 
         disp = results[0]
@@ -35,26 +44,19 @@ class TestParseDisplacements:
         assert disp.translations.shape[1] == 3
         assert disp.rotations.shape[1] == 3
 
-        # Check specific known values from reference output
-        # Node 11: T1=0.0, T2=6.326195E-04, T3=3.889221E-02
-        idx_11 = np.where(disp.node_ids == 11)[0]
-        assert len(idx_11) == 1
-        np.testing.assert_allclose(
-            disp.translations[idx_11[0]],
-            [0.0, 6.326195e-04, 3.889221e-02],
-            rtol=1e-5,
-        )
-
-        # Node 16: T3=-4.237940E-01
-        idx_16 = np.where(disp.node_ids == 16)[0]
-        assert len(idx_16) == 1
-        np.testing.assert_allclose(disp.translations[idx_16[0], 2], -4.237940e-01, rtol=1e-5)
+    @pytest.mark.parametrize(
+        "exp", EXPECTED_D01011A_DISP, ids=lambda e: f"node{e['nid']}-t{e['comp'] + 1}"
+    )
+    def test_reference_values(self, d01011a_node_index: dict, parsed_d01011a: dict, exp) -> None:
+        """Check parsed translations against the reference-value table."""
+        disp = parsed_d01011a["displacements"][0]
+        assert_close(disp.translations[d01011a_node_index[exp["nid"]], exp["comp"]], exp["val"])
 
 
 class TestParseEigenvalues:
-    def test_parse_reference_output(self, reference_output_d03011a: str) -> None:
+    def test_parse_reference_output(self, parsed_d03011a: dict) -> None:
         """Parse eigenvalues from the d03011a reference output."""
-        result = parse_eigenvalues(reference_output_d03011a)
+        result = parsed_d03011a["eigenvalues"]
         assert result is not None
 
         # d03011a is a 10x20 plate vibration problem with 3 modes
@@ -64,19 +66,18 @@ class TestParseEigenvalues:
         assert result.mode_numbers[2] == 3
 
         # Check known eigenvalues
-        np.testing.assert_allclose(result.eigenvalues[0], 3.237408e01, rtol=1e-5)
-        np.testing.assert_allclose(result.frequencies[0], 9.055634e-01, rtol=1e-5)
+        assert_close(result.eigenvalues[0], 3.237408e01)
+        assert_close(result.frequencies[0], 9.055634e-01)
 
-    def test_no_eigenvalues(self, reference_output_d01011a: str) -> None:
+    def test_no_eigenvalues(self, parsed_d01011a: dict) -> None:
         """Static analysis should have no eigenvalues."""
-        result = parse_eigenvalues(reference_output_d01011a)
-        assert result is None
+        assert parsed_d01011a["eigenvalues"] is None
 
 
 class TestParseStresses:
-    def test_parse_membrane_stresses(self, reference_output_d01011a: str) -> None:
+    def test_parse_membrane_stresses(self, parsed_d01011a: dict) -> None:
         """Parse membrane stresses from d01011a."""
-        results = parse_membrane_stresses(reference_output_d01011a)
+        results = parsed_d01011a["membrane"]
         assert len(results) >= 1
 
         # Find CQDMEM results
@@ -85,21 +86,21 @@ class TestParseStresses:
 
         stress = qdmem[0]
         assert len(stress.element_ids) > 0
-        assert "normal_x" in stress.stresses
-        assert "normal_y" in stress.stresses
-        assert "shear_xy" in stress.stresses
+        assert "normal_x" in stress
+        assert "normal_y" in stress
+        assert "shear_xy" in stress
+        assert stress.values.shape == (len(stress.element_ids), len(stress.components))
 
         # Element 1: NORMAL-X = 1.067032E+03
-        idx_1 = np.where(stress.element_ids == 1)[0]
-        assert len(idx_1) == 1
-        np.testing.assert_allclose(stress.stresses["normal_x"][idx_1[0]], 1.067032e03, rtol=1e-5)
+        elems = id_index(stress.element_ids)
+        assert_close(stress["normal_x"][elems[1]], 1.067032e03)
 
-    def test_parse_shear_stresses(self, reference_output_d01011a: str) -> None:
+    def test_parse_shear_stresses(self, parsed_d01011a: dict) -> None:
         """Parse shear panel stresses from d01011a."""
-        results = parse_shear_stresses(reference_output_d01011a)
+        results = parsed_d01011a["shear"]
         assert len(results) >= 1
 
         shear = results[0]
         assert shear.element_type == "CSHEAR"
         assert len(shear.element_ids) > 0
-        assert "max_shear" in shear.stresses
+        assert "max_shear" in shear
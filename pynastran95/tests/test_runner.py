@@ -5,18 +5,23 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from tests.conftest import INP_CLEAN_DIR
+from tests.conftest import (
+    D01011A_INP,
+    D03011A_INP,
+    DEMOOUT_DIR,
+    assert_close,
+    id_index,
+    requires_d01011a,
+    requires_d03011a,
+)
 
 
 class TestNastranRunner:
     @pytest.mark.slow
+    @requires_d01011a
     def test_run_static_analysis(self, nastran_runner) -> None:
         """Run the d01011a static analysis demo problem."""
-        input_file = INP_CLEAN_DIR / "d01011a.inp"
-        if not input_file.exists():
-            pytest.skip("Input file not found")
-
-        result = nastran_runner.run(input_file, timeout=120.0)
+        result = nastran_runner.run(D01011A_INP, timeout=120.0)
 
         assert result.completed, f"NASTRAN did not complete. RC={result.returncode}"
         assert result.returncode == 0
@@ -25,47 +30,69 @@ class TestNastranRunner:
 
         # Check displacement values match reference
         disp = result.displacements[0]
-        idx_11 = np.where(disp.node_ids == 11)[0]
-        assert len(idx_11) == 1
+        nodes = id_index(disp.node_ids)
+        assert 11 in nodes
         # T3 for node 11 should be ~0.0389
-        np.testing.assert_allclose(disp.translations[idx_11[0], 2], 3.889221e-02, rtol=0.05)
+        assert_close(disp.translations[nodes[11], 2], 3.889221e-02, rtol=0.05)
 
     @pytest.mark.slow
+    @requires_d03011a
     def test_run_normal_modes(self, nastran_runner) -> None:
         """Run the d03011a normal modes demo problem."""
-        input_file = INP_CLEAN_DIR / "d03011a.inp"
-        if not input_file.exists():
-            pytest.skip("Input file not found")
-
-        result = nastran_runner.run(input_file, timeout=120.0)
+        result = nastran_runner.run(D03011A_INP, timeout=120.0)
 
         assert result.completed, f"NASTRAN did not complete. RC={result.returncode}"
         assert result.eigenvalues is not None
         assert len(result.eigenvalues.mode_numbers) == 3
         # First frequency should be ~0.906 Hz
-        np.testing.assert_allclose(result.eigenvalues.frequencies[0], 9.055634e-01, rtol=0.05)
+        assert_close(result.eigenvalues.frequencies[0], 9.055634e-01, rtol=0.05)
 
     @pytest.mark.slow
-    def test_run_from_string(self, nastran_runner) -> None:
+    def test_run_from_string(self, nastran_runner, d01011a_text: str) -> None:
         """Run NASTRAN from an input deck string."""
-        input_file = INP_CLEAN_DIR / "d01011a.inp"
-        if not input_file.exists():
-            pytest.skip("Input file not found")
-
-        input_text = input_file.read_text()
-        result = nastran_runner.run(input_text, timeout=120.0)
+        result = nastran_runner.run(d01011a_text, timeout=120.0)
 
         assert result.completed
         assert len(result.displacements) > 0
 
     @pytest.mark.slow
+    @requires_d01011a
+    def test_batch(self, nastran_runner) -> None:
+        """Run two analyses through the shared-scratch batch API."""
+        results = list(nastran_runner.batch([D01011A_INP, D01011A_INP], timeout=120.0))
+
+        assert len(results) == 2
+        for result in results:
+            assert result.completed
+            assert len(result.displacements) > 0
+
+    @pytest.mark.slow
+    @requires_d01011a
     def test_run_convenience_function(self) -> None:
         """Test the module-level run() convenience function."""
         from pynastran95 import run
 
-        input_file = INP_CLEAN_DIR / "d01011a.inp"
-        if not input_file.exists():
-            pytest.skip("Input file not found")
-
-        result = run(input_file, timeout=120.0)
+        result = run(D01011A_INP, timeout=120.0)
         assert result.completed
+
+
+class TestParseMany:
+    def test_parse_many_matches_serial(self) -> None:
+        """parse_many returns the same results as parsing each file serially."""
+        from pynastran95 import parse_many
+        from pynastran95.runner import _parse_file
+
+        paths = sorted(DEMOOUT_DIR.glob("d01011*.out"))
+        if not paths:
+            pytest.skip("Reference outputs not found")
+
+        results = parse_many(paths, workers=2)
+
+        assert len(results) == len(paths)
+        for result, path in zip(results, paths, strict=True):
+            serial = _parse_file(path)
+            assert result.completed == serial.completed
+            assert len(result.displacements) == len(serial.displacements)
+            for a, b in zip(result.displacements, serial.displacements, strict=True):
+                np.testing.assert_array_equal(a.node_ids, b.node_ids)
+                np.testing.assert_array_equal(a.translations, b.translations)